@@ -0,0 +1,144 @@
+// 由 scripts/update_news.py 自动生成，请勿手动编辑
+const contentDatabase = {
+  "summaries": [
+    [
+      {
+        "text": "OpenAI is sharing preliminary cybersecurity evaluations for Astra and the steps we’re taking to strengthen safeguards an...",
+        "source": "OpenAI Blog",
+        "url": "https://openai.com/index/responding-next-frontier-critical-cyber-capabilities"
+      },
+      {
+        "text": "OpenAI said this model, which is still in development, reached its \"critical cybersecurity threshold,\" meaning it could ...",
+        "source": "TechCrunch AI",
+        "url": "https://techcrunch.com/2026/08/07/openai-says-it-slowed-astra-model-development-over-security-concerns/"
+      },
+      {
+        "text": "This story originally appeared in The Algorithm, our weekly newsletter on AI. To get stories like this in your inbox fir...",
+        "source": "MIT Tech Review",
+        "url": "https://www.technologyreview.com/2026/08/03/1141056/trumps-ai-protectionism-has-come-for-robotics/"
+      }
+    ]
+  ],
+  "categories": {
+    "bigModel": {
+      "title": "大模型",
+      "desc": "GPT-5、Claude 4、Gemini Ultra 等前沿大模型技术突破与商业化进展追踪",
+      "icon": "M9.75 17L9 20l-1 1h8l-1-1-.75-3M3 13h18M5 17h14a2 2 0 002-2V5a2 2 0 00-2-2H5a2 2 0 00-2 2v10a2 2 0 002 2z",
+      "articles": [
+        {
+          "title": "Responding to the next frontier of critical cyber capabilities",
+          "link": "https://openai.com/index/responding-next-frontier-critical-cyber-capabilities",
+          "date": "Fri, 07 Aug 2026 15:20:00 GMT",
+          "summary": "OpenAI is sharing preliminary cybersecurity evaluations for Astra and the steps we’re taking to strengthen safeguards and security controls.",
+          "source": "OpenAI Blog",
+          "readTime": "5 分钟",
+          "content": "<p>OpenAI is sharing preliminary cybersecurity evaluations for Astra and the steps we’re taking to strengthen safeguards and security controls.</p><p><a href='https://openai.com/index/responding-next-frontier-critical-cyber-capabilities' target='_blank'>查看原文：OpenAI Blog</a></p>"
+        },
+        {
+          "title": "How HSP GRUPPE builds AI capabilities for tax advisory",
+          "link": "https://openai.com/index/hsp-gruppe",
+          "date": "Fri, 07 Aug 2026 09:00:00 GMT",
+          "summary": "Discover how HSP GRUPPE uses ChatGPT Enterprise to boost productivity, improve work quality, and create more capacity for tax advisory and client serv...",
+          "source": "OpenAI Blog",
+          "readTime": "5 分钟",
+          "content": "<p>Discover how HSP GRUPPE uses ChatGPT Enterprise to boost productivity, improve work quality, and create more capacity for tax advisory and client service.</p><p><a href='https://openai.com/index/hsp-gruppe' target='_blank'>查看原文：OpenAI Blog</a></p>"
+        },
+        {
+          "title": "Improving GPT‑5.6 Sol in ChatGPT—and expanding access to GPT-5.6 Luna for free users",
+          "link": "https://openai.com/index/improving-gpt-5-6-sol-in-chatgpt",
+          "date": "Thu, 06 Aug 2026 10:00:00 GMT",
+          "summary": "ChatGPT introduces improved GPT-5.6 Sol with better accuracy and consistency, plus expanded access for free users and unlimited everyday chats with GP...",
+          "source": "OpenAI Blog",
+          "readTime": "5 分钟",
+          "content": "<p>ChatGPT introduces improved GPT-5.6 Sol with better accuracy and consistency, plus expanded access for free users and unlimited everyday chats with GPT-5.6 Luna.</p><p><a href='https://openai.com/index/improving-gpt-5-6-sol-in-chatgpt' target='_blank'>查看原文：OpenAI Blog</a></p>"
+        }
+      ]
+    },
+    "hardware": {
+      "title": "AI 硬件",
+      "desc": "算力芯片、机器人、端侧设备、AI Phone 等硬件载体技术革新与产业链动向",
+      "icon": "M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2zM9 9h6v6H9V9z",
+      "articles": []
+    },
+    "global": {
+      "title": "出海动态",
+      "desc": "中国 AI 企业全球化布局、海外监管政策、跨境投融资与本地化战略分析",
+      "icon": "M3.055 11H5a2 2 0 012 2v1a2 2 0 002 2 2 2 0 012 2v2.945M8 3.935V5.5A2.5 2.5 0 0010.5 8h.5a2 2 0 012 2 2 2 0 104 0 2 2 0 012-2h1.064M15 20.488V18a2 2 0 012-2h3.064M21 12a9 9 0 11-18 0 9 9 0 0118 0z",
+      "articles": []
+    },
+    "investment": {
+      "title": "投融资",
+      "desc": "一级市场融资速递、独角兽估值变动、IPO 动态与资本风向解读",
+      "icon": "M12 8c-1.657 0-3 .895-3 2s1.343 2 3 2 3 .895 3 2-1.343 2-3 2m0-8c1.11 0 2.08.402 2.599 1M12 8V7m0 1v8m0 0v1m0-1c-1.11 0-2.08-.402-2.599-1M21 12a9 9 0 11-18 0 9 9 0 0118 0z",
+      "articles": [
+        {
+          "title": "OpenAI says it slowed Astra model development over security concerns",
+          "link": "https://techcrunch.com/2026/08/07/openai-says-it-slowed-astra-model-development-over-security-concerns/",
+          "date": "Fri, 07 Aug 2026 22:48:24 +0000",
+          "summary": "OpenAI said this model, which is still in development, reached its \"critical cybersecurity threshold,\" meaning it could independently identify and car...",
+          "source": "TechCrunch AI",
+          "readTime": "5 分钟",
+          "content": "<p>OpenAI said this model, which is still in development, reached its \"critical cybersecurity threshold,\" meaning it could independently identify and carry out cyberattacks against traditionally well-pro</p><p><a href='https://techcrunch.com/2026/08/07/openai-says-it-slowed-astra-model-development-over-security-concerns/' target='_blank'>查看原文：TechCrunch AI</a></p>"
+        },
+        {
+          "title": "After Rippling blew millions on AI in months, it built an employee ROI tool",
+          "link": "https://techcrunch.com/2026/08/07/after-rippling-blew-millions-on-ai-in-months-it-built-an-employee-roi-tool/",
+          "date": "Fri, 07 Aug 2026 21:30:11 +0000",
+          "summary": "After its own AI usage wake-up call, Rippling this week unveiled AI Spend Console, a product that tracks individual and team employee AI spending.",
+          "source": "TechCrunch AI",
+          "readTime": "5 分钟",
+          "content": "<p>After its own AI usage wake-up call, Rippling this week unveiled AI Spend Console, a product that tracks individual and team employee AI spending.</p><p><a href='https://techcrunch.com/2026/08/07/after-rippling-blew-millions-on-ai-in-months-it-built-an-employee-roi-tool/' target='_blank'>查看原文：TechCrunch AI</a></p>"
+        },
+        {
+          "title": "Cloudflare launches Kitesurf, a browser built for AI agents",
+          "link": "https://techcrunch.com/2026/08/07/cloudflare-launches-kitesurf-a-browser-built-for-ai-agents/",
+          "date": "Fri, 07 Aug 2026 16:16:09 +0000",
+          "summary": "Kitesurf is a cloud-hosted browser designed for AI agents instead of people. It uses less computing power than Chromium for common automation tasks, h...",
+          "source": "TechCrunch AI",
+          "readTime": "5 分钟",
+          "content": "<p>Kitesurf is a cloud-hosted browser designed for AI agents instead of people. It uses less computing power than Chromium for common automation tasks, helping developers build browser-based AI agents mo</p><p><a href='https://techcrunch.com/2026/08/07/cloudflare-launches-kitesurf-a-browser-built-for-ai-agents/' target='_blank'>查看原文：TechCrunch AI</a></p>"
+        }
+      ]
+    },
+    "industry": {
+      "title": "产业观察",
+      "desc": "行业政策解读、竞争格局分析、技术趋势预测与商业模式演进研究",
+      "icon": "M19 21V5a2 2 0 00-2-2H7a2 2 0 00-2 2v16m14 0h2m-2 0h-5m-9 0H3m2 0h5M9 7h1m-1 4h1m4-4h1m-1 4h1m-5 10v-5a1 1 0 011-1h2a1 1 0 011 1v5m-4 0h4",
+      "articles": [
+        {
+          "title": "Trump’s AI protectionism has come for robotics",
+          "link": "https://www.technologyreview.com/2026/08/03/1141056/trumps-ai-protectionism-has-come-for-robotics/",
+          "date": "Mon, 03 Aug 2026 18:43:30 +0000",
+          "summary": "This story originally appeared in The Algorithm, our weekly newsletter on AI. To get stories like this in your inbox first,&#160;sign up here. Humanoi...",
+          "source": "MIT Tech Review",
+          "readTime": "5 分钟",
+          "content": "<p>This story originally appeared in The Algorithm, our weekly newsletter on AI. To get stories like this in your inbox first,&#160;sign up here. Humanoid robots usually elicit more cringe than awe: They</p><p><a href='https://www.technologyreview.com/2026/08/03/1141056/trumps-ai-protectionism-has-come-for-robotics/' target='_blank'>查看原文：MIT Tech Review</a></p>"
+        },
+        {
+          "title": "Here’s why AI agents lie and cheat to reach their goals",
+          "link": "https://www.technologyreview.com/2026/08/03/1141009/heres-why-ai-agents-lie-and-cheat-to-reach-their-goals/",
+          "date": "Mon, 03 Aug 2026 08:30:05 +0000",
+          "summary": "MIT Technology Review Explains: Let our writers untangle the complex, messy world of technology to help you understand what’s coming next. You can rea...",
+          "source": "MIT Tech Review",
+          "readTime": "5 分钟",
+          "content": "<p>MIT Technology Review Explains: Let our writers untangle the complex, messy world of technology to help you understand what’s coming next. You can read more from the series here. When two OpenAI model</p><p><a href='https://www.technologyreview.com/2026/08/03/1141009/heres-why-ai-agents-lie-and-cheat-to-reach-their-goals/' target='_blank'>查看原文：MIT Tech Review</a></p>"
+        },
+        {
+          "title": "A fundamental flaw leaves LLMs strikingly vulnerable to attack",
+          "link": "https://www.technologyreview.com/2026/07/30/1140927/a-fundamental-flaw-leaves-llms-vulnerable-to-attack/",
+          "date": "Thu, 30 Jul 2026 10:15:19 +0000",
+          "summary": "It is impossible to make large language models fully secure against hacks because of a fundamental flaw in how they work, a team of researchers argue ...",
+          "source": "MIT Tech Review",
+          "readTime": "5 分钟",
+          "content": "<p>It is impossible to make large language models fully secure against hacks because of a fundamental flaw in how they work, a team of researchers argue in a paper presented at the International Conferen</p><p><a href='https://www.technologyreview.com/2026/07/30/1140927/a-fundamental-flaw-leaves-llms-vulnerable-to-attack/' target='_blank'>查看原文：MIT Tech Review</a></p>"
+        }
+      ]
+    },
+    "product": {
+      "title": "产品快讯",
+      "desc": "AI 应用新品发布、功能更新、用户体验优化与市场化策略追踪报道",
+      "icon": "M13 10V3L4 14h7v7l9-11h-7z",
+      "articles": []
+    }
+  }
+};
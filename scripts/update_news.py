@@ -1,13 +1,58 @@
 #!/usr/bin/env python3
 import os
 import re
+import sys
 import json
-import html
-from datetime import datetime, timedelta
-from urllib.parse import urljoin
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 分类元数据（标题、描述、图标），保底数据与每次构建共用
+CATEGORY_META = {
+    "bigModel": {
+        "title": "大模型",
+        "desc": "GPT-5、Claude 4、Gemini Ultra 等前沿大模型技术突破与商业化进展追踪",
+        "icon": "M9.75 17L9 20l-1 1h8l-1-1-.75-3M3 13h18M5 17h14a2 2 0 002-2V5a2 2 0 00-2-2H5a2 2 0 00-2 2v10a2 2 0 002 2z"
+    },
+    "hardware": {
+        "title": "AI 硬件",
+        "desc": "算力芯片、机器人、端侧设备、AI Phone 等硬件载体技术革新与产业链动向",
+        "icon": "M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2zM9 9h6v6H9V9z"
+    },
+    "global": {
+        "title": "出海动态",
+        "desc": "中国 AI 企业全球化布局、海外监管政策、跨境投融资与本地化战略分析",
+        "icon": "M3.055 11H5a2 2 0 012 2v1a2 2 0 002 2 2 2 0 012 2v2.945M8 3.935V5.5A2.5 2.5 0 0010.5 8h.5a2 2 0 012 2 2 2 0 104 0 2 2 0 012-2h1.064M15 20.488V18a2 2 0 012-2h3.064M21 12a9 9 0 11-18 0 9 9 0 0118 0z"
+    },
+    "investment": {
+        "title": "投融资",
+        "desc": "一级市场融资速递、独角兽估值变动、IPO 动态与资本风向解读",
+        "icon": "M12 8c-1.657 0-3 .895-3 2s1.343 2 3 2 3 .895 3 2-1.343 2-3 2m0-8c1.11 0 2.08.402 2.599 1M12 8V7m0 1v8m0 0v1m0-1c-1.11 0-2.08-.402-2.599-1M21 12a9 9 0 11-18 0 9 9 0 0118 0z"
+    },
+    "industry": {
+        "title": "产业观察",
+        "desc": "行业政策解读、竞争格局分析、技术趋势预测与商业模式演进研究",
+        "icon": "M19 21V5a2 2 0 00-2-2H7a2 2 0 00-2 2v16m14 0h2m-2 0h-5m-9 0H3m2 0h5M9 7h1m-1 4h1m4-4h1m-1 4h1m-5 10v-5a1 1 0 011-1h2a1 1 0 011 1v5m-4 0h4"
+    },
+    "product": {
+        "title": "产品快讯",
+        "desc": "AI 应用新品发布、功能更新、用户体验优化与市场化策略追踪报道",
+        "icon": "M13 10V3L4 14h7v7l9-11h-7z"
+    }
+}
+
+def new_categories(articles_by_cat=None):
+    """按 CATEGORY_META 生成分类结构，只有 articles 列表是新分配的"""
+    articles_by_cat = articles_by_cat or {}
+    return {
+        key: {**meta, "articles": list(articles_by_cat.get(key, []))}
+        for key, meta in CATEGORY_META.items()
+    }
 
 # 保底数据 - 当RSS抓取失败时自动使用（防止页面空白）
 FALLBACK_DATA = {
@@ -28,49 +73,15 @@ FALLBACK_DATA = {
             "url": "https://blogs.nvidia.com"
         }
     ]],
-    "categories": {
-        "bigModel": {
-            "title": "大模型",
-            "desc": "GPT-5、Claude 4、Gemini Ultra 等前沿大模型技术突破与商业化进展追踪",
-            "icon": "M9.75 17L9 20l-1 1h8l-1-1-.75-3M3 13h18M5 17h14a2 2 0 002-2V5a2 2 0 00-2-2H5a2 2 0 00-2 2v10a2 2 0 002 2z",
-            "articles": [
-                {"title": "OpenAI GPT-5最新技术进展", "link": "https://openai.com/blog", "date": "", "summary": "OpenAI发布最新模型能力更新", "source": "OpenAI Blog", "readTime": "5 分钟", "content": "<p>OpenAI最新动态</p><p><a href='https://openai.com/blog' target='_blank'>查看原文</a></p>"},
-                {"title": "Anthropic Claude 4能力升级", "link": "https://www.anthropic.com/news", "date": "", "summary": "Claude系列模型新功能发布", "source": "Anthropic News", "readTime": "4 分钟", "content": "<p>Anthropic最新动态</p><p><a href='https://www.anthropic.com/news' target='_blank'>查看原文</a></p>"}
-            ]
-        },
-        "hardware": {
-            "title": "AI 硬件",
-            "desc": "算力芯片、机器人、端侧设备、AI Phone 等硬件载体技术革新与产业链动向",
-            "icon": "M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2zM9 9h6v6H9V9z",
-            "articles": [
-                {"title": "NVIDIA新一代AI芯片发布", "link": "https://blogs.nvidia.com", "date": "", "summary": "GPU架构升级，推理性能提升", "source": "NVIDIA Blog", "readTime": "6 分钟", "content": "<p>NVIDIA最新硬件动态</p><p><a href='https://blogs.nvidia.com' target='_blank'>查看原文</a></p>"}
-            ]
-        },
-        "global": {
-            "title": "出海动态",
-            "desc": "中国 AI 企业全球化布局、海外监管政策、跨境投融资与本地化战略分析",
-            "icon": "M3.055 11H5a2 2 0 012 2v1a2 2 0 002 2 2 2 0 012 2v2.945M8 3.935V5.5A2.5 2.5 0 0010.5 8h.5a2 2 0 012 2 2 2 0 104 0 2 2 0 012-2h1.064M15 20.488V18a2 2 0 012-2h3.064M21 12a9 9 0 11-18 0 9 9 0 0118 0z",
-            "articles": []
-        },
-        "investment": {
-            "title": "投融资",
-            "desc": "一级市场融资速递、独角兽估值变动、IPO 动态与资本风向解读",
-            "icon": "M12 8c-1.657 0-3 .895-3 2s1.343 2 3 2 3 .895 3 2-1.343 2-3 2m0-8c1.11 0 2.08.402 2.599 1M12 8V7m0 1v8m0 0v1m0-1c-1.11 0-2.08-.402-2.599-1M21 12a9 9 0 11-18 0 9 9 0 0118 0z",
-            "articles": []
-        },
-        "industry": {
-            "title": "产业观察",
-            "desc": "行业政策解读、竞争格局分析、技术趋势预测与商业模式演进研究",
-            "icon": "M19 21V5a2 2 0 00-2-2H7a2 2 0 00-2 2v16m14 0h2m-2 0h-5m-9 0H3m2 0h5M9 7h1m-1 4h1m4-4h1m-1 4h1m-5 10v-5a1 1 0 011-1h2a1 1 0 011 1v5m-4 0h4",
-            "articles": []
-        },
-        "product": {
-            "title": "产品快讯",
-            "desc": "AI 应用新品发布、功能更新、用户体验优化与市场化策略追踪报道",
-            "icon": "M13 10V3L4 14h7v7l9-11h-7z",
-            "articles": []
-        }
-    }
+    "categories": new_categories({
+        "bigModel": [
+            {"title": "OpenAI GPT-5最新技术进展", "link": "https://openai.com/blog", "date": "", "summary": "OpenAI发布最新模型能力更新", "source": "OpenAI Blog", "readTime": "5 分钟", "content": "<p>OpenAI最新动态</p><p><a href='https://openai.com/blog' target='_blank'>查看原文</a></p>"},
+            {"title": "Anthropic Claude 4能力升级", "link": "https://www.anthropic.com/news", "date": "", "summary": "Claude系列模型新功能发布", "source": "Anthropic News", "readTime": "4 分钟", "content": "<p>Anthropic最新动态</p><p><a href='https://www.anthropic.com/news' target='_blank'>查看原文</a></p>"}
+        ],
+        "hardware": [
+            {"title": "NVIDIA新一代AI芯片发布", "link": "https://blogs.nvidia.com", "date": "", "summary": "GPU架构升级，推理性能提升", "source": "NVIDIA Blog", "readTime": "6 分钟", "content": "<p>NVIDIA最新硬件动态</p><p><a href='https://blogs.nvidia.com' target='_blank'>查看原文</a></p>"}
+        ]
+    })
 }
 
 # 主要信源配置（只保留稳定的英文源）
@@ -84,20 +95,119 @@ SOURCES = [
     {"name": "MIT Tech Review", "url": "https://www.technologyreview.com/topic/artificial-intelligence/feed", "cat": "industry"},
 ]
 
-def fetch_rss_simple(url, name):
-    """简化版RSS抓取"""
+# 共享会话：keep-alive 复用连接，各抓取线程共用连接池
+# 重试只覆盖连接失败与 429/5xx（短退避、忽略 Retry-After），读超时不重试；
+# 每源最多重试一次，最坏约 2 × (3 + 10) 秒（每次尝试连接 + 读超时）再加 0.3 秒退避
+REQUEST_TIMEOUT = (3, 10)
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "Mozilla/5.0 (compatible; DATOU-News-Daily/1.0)"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=1,
+        connect=1,
+        read=0,
+        status=1,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=False
+    )
+))
+
+# 抓取在线程池中进行，日志加锁逐行输出，避免多线程输出交错
+PRINT_LOCK = threading.Lock()
+
+def log(message):
+    with PRINT_LOCK:
+        print(message)
+
+# 预编译正则：HTML 标签剥离
+TAG_RE = re.compile(r'<[^>]+>')
+
+# 前端数据文件，index.html 通过 <script src="data.js"> 引用
+DATA_JS_FILE = 'data.js'
+
+# 条件请求缓存：记录各源的 ETag / Last-Modified 及上次解析结果
+FEED_CACHE_FILE = '.feed_cache.json'
+# 缓存格式版本：条目生成方式变化时递增，旧版本缓存整体作废
+FEED_CACHE_VERSION = 2
+# 缓存新鲜期：距上次成功抓取不足该秒数时直接复用，不发请求（手动重跑/重试时生效）
+FEED_CACHE_TTL = 30 * 60
+
+# 熔断：连续失败达到次数后暂停抓取该源一小时，暂停期间沿用上次缓存的条目
+MAX_FAILS = 3
+FAIL_PAUSE = 3600
+
+def load_feed_cache():
+    """读取条件请求缓存，不存在、损坏或版本不符时返回空缓存"""
+    try:
+        with open(FEED_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != FEED_CACHE_VERSION:
+        return {}
+    return data.get('feeds', {})
+
+def save_feed_cache(cache):
+    """原子写回条件请求缓存"""
+    tmp_path = FEED_CACHE_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": FEED_CACHE_VERSION, "feeds": cache}, f, ensure_ascii=False)
+    os.replace(tmp_path, FEED_CACHE_FILE)
+
+def fetch_rss_simple(url, name, cache, offline=False):
+    """简化版RSS抓取（支持 ETag / If-Modified-Since 条件请求；离线模式只读缓存）"""
     try:
-        print(f"  抓取: {name}...")
-        feed = feedparser.parse(url)
+        log(f"  抓取: {name}...")
+        cached = cache.get(url, {})
+        if offline:
+            entries = cached.get('entries', [])
+            log(f"    ✓ {name}: 离线模式，使用缓存 {len(entries)} 条")
+            return entries
+        
+        if cached.get('entries') and time.time() - cached.get('fetched_at', 0) < FEED_CACHE_TTL:
+            log(f"    ✓ {name}: 缓存未过期，使用缓存 {len(cached['entries'])} 条")
+            return cached['entries']
+        
+        if cached.get('fails', 0) >= MAX_FAILS and time.time() < cached.get('retry_after', 0):
+            entries = cached.get('entries', [])
+            log(f"    ⏸ {name}: 连续失败 {cached['fails']} 次，暂停抓取，使用缓存 {len(entries)} 条")
+            return entries
+        
+        headers = {}
+        if cached.get('entries'):
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('modified'):
+                headers['If-Modified-Since'] = cached['modified']
+        
+        resp = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 304 and cached.get('entries'):
+            cache[url] = {
+                "etag": cached.get('etag'),
+                "modified": cached.get('modified'),
+                "entries": cached['entries'],
+                "fetched_at": time.time()
+            }
+            log(f"    ✓ {name}: 未更新，使用缓存 {len(cached['entries'])} 条")
+            return cached['entries']
+        resp.raise_for_status()
+        # 摘要随后会剥离全部标签，跳过相对链接解析；保留 HTML 清洗（连同内容一起移除 script/style）
+        # 传入响应头：content-location 提供相对链接的基准 URL，content-type 提供字符集
+        response_headers = {k.lower(): v for k, v in resp.headers.items()}
+        response_headers['content-location'] = resp.url
+        feed = feedparser.parse(resp.content, response_headers=response_headers, resolve_relative_uris=False)
         
         if not feed.entries:
-            print(f"    ⚠️ {name} 无数据")
+            log(f"    ⚠️ {name} 无数据")
             return []
         
         entries = []
         for entry in feed.entries[:3]:
-            summary = entry.get('summary', entry.get('description', ''))
-            clean_summary = re.sub(r'<[^>]+>', '', summary)
+            summary = entry.get('summary') or entry.get('description') or ''
+            clean_summary = TAG_RE.sub('', summary)
             
             entries.append({
                 "title": entry.title,
@@ -109,56 +219,67 @@ def fetch_rss_simple(url, name):
                 "content": f"<p>{clean_summary[:200]}</p><p><a href='{entry.link}' target='_blank'>查看原文：{name}</a></p>"
             })
         
-        print(f"    ✓ {name}: {len(entries)} 条")
+        cache[url] = {
+            "etag": resp.headers.get('ETag'),
+            "modified": resp.headers.get('Last-Modified'),
+            "entries": entries,
+            "fetched_at": time.time()
+        }
+        log(f"    ✓ {name}: {len(entries)} 条")
         return entries
         
     except Exception as e:
-        print(f"    ✗ {name}: 失败")
-        return []
+        fails = cache.get(url, {}).get('fails', 0) + 1
+        cache[url] = {
+            **cache.get(url, {}),
+            "fails": fails,
+            "retry_after": time.time() + FAIL_PAUSE
+        }
+        log(f"    ✗ {name}: 失败 ({e})")
+        return cache[url].get('entries', [])
 
-def build_database():
-    """构建数据库"""
+def build_database(offline=False):
+    """构建数据库（离线模式下没有任何缓存条目时返回 None）"""
     print("\n开始抓取数据...")
     
-    # 初始化数据结构
-    database = {
-        "summaries": [[]],
-        "categories": {
-            "bigModel": {"title": "大模型", "desc": "GPT-5、Claude 4、Gemini Ultra 等前沿大模型技术突破与商业化进展追踪", "icon": "M9.75 17L9 20l-1 1h8l-1-1-.75-3M3 13h18M5 17h14a2 2 0 002-2V5a2 2 0 00-2-2H5a2 2 0 00-2 2v10a2 2 0 002 2z", "articles": []},
-            "hardware": {"title": "AI 硬件", "desc": "算力芯片、机器人、端侧设备、AI Phone 等硬件载体技术革新与产业链动向", "icon": "M9 3v2m6-2v2M9 19v2m6-2v2M5 9H3m2 6H3m18-6h-2m2 6h-2M7 19h10a2 2 0 002-2V7a2 2 0 00-2-2H7a2 2 0 00-2 2v10a2 2 0 002 2zM9 9h6v6H9V9z", "articles": []},
-            "global": {"title": "出海动态", "desc": "中国 AI 企业全球化布局、海外监管政策、跨境投融资与本地化战略分析", "icon": "M3.055 11H5a2 2 0 012 2v1a2 2 0 002 2 2 2 0 012 2v2.945M8 3.935V5.5A2.5 2.5 0 0010.5 8h.5a2 2 0 012 2 2 2 0 104 0 2 2 0 012-2h1.064M15 20.488V18a2 2 0 012-2h3.064M21 12a9 9 0 11-18 0 9 9 0 0118 0z", "articles": []},
-            "investment": {"title": "投融资", "desc": "一级市场融资速递、独角兽估值变动、IPO 动态与资本风向解读", "icon": "M12 8c-1.657 0-3 .895-3 2s1.343 2 3 2 3 .895 3 2-1.343 2-3 2m0-8c1.11 0 2.08.402 2.599 1M12 8V7m0 1v8m0 0v1m0-1c-1.11 0-2.08-.402-2.599-1M21 12a9 9 0 11-18 0 9 9 0 0118 0z", "articles": []},
-            "industry": {"title": "产业观察", "desc": "行业政策解读、竞争格局分析、技术趋势预测与商业模式演进研究", "icon": "M19 21V5a2 2 0 00-2-2H7a2 2 0 00-2 2v16m14 0h2m-2 0h-5m-9 0H3m2 0h5M9 7h1m-1 4h1m4-4h1m-1 4h1m-5 10v-5a1 1 0 011-1h2a1 1 0 011 1v5m-4 0h4", "articles": []},
-            "product": {"title": "产品快讯", "desc": "AI 应用新品发布、功能更新、用户体验优化与市场化策略追踪报道", "icon": "M13 10V3L4 14h7v7l9-11h-7z", "articles": []},
-        }
-    }
-    
     all_articles = []
+    feed_cache = load_feed_cache()
     
-    # 抓取各源数据
+    # 同一 URL 只抓取一次（多个分类共用的源不重复下载）
+    unique_sources = {}
     for source in SOURCES:
-        entries = fetch_rss_simple(source['url'], source['name'])
-        if entries:
-            cat = source['cat']
-            database['categories'][cat]['articles'].extend(entries)
-            all_articles.extend(entries)
+        unique_sources.setdefault(source['url'], source)
+    
+    # 并发抓取各源数据（网络IO为主，线程足够）
+    with ThreadPoolExecutor(max_workers=len(unique_sources)) as executor:
+        results = executor.map(lambda s: fetch_rss_simple(s['url'], s['name'], feed_cache, offline), unique_sources.values())
+        fetched = dict(zip(unique_sources, results))
+    
+    if not offline:
+        try:
+            save_feed_cache(feed_cache)
+        except OSError as e:
+            print(f"⚠️ 缓存写入失败: {e}")
+    
+    # 按分类归集，以链接为键边收集边去重（保持首次出现的顺序）
+    articles_by_cat = {key: {} for key in CATEGORY_META}
+    for source in SOURCES:
+        entries = fetched[source['url']]
+        by_link = articles_by_cat[source['cat']]
+        for entry in entries:
+            by_link.setdefault(entry['link'], entry)
+        all_articles.extend(entries)
+    
+    # 离线模式只能使用已有缓存，没有缓存时不能用保底数据覆盖现有 data.js
+    if not all_articles and offline:
+        print(f"\n✗ 离线模式：{FEED_CACHE_FILE} 中没有可用的缓存条目")
+        return None
     
     # 如果没有抓到任何数据，使用保底数据
     if not all_articles:
         print("\n⚠️ 所有RSS源失败，使用保底数据")
         return FALLBACK_DATA
     
-    # 去重
-    for cat_key in database['categories']:
-        articles = database['categories'][cat_key]['articles']
-        seen = set()
-        unique = []
-        for a in articles:
-            if a['link'] not in seen:
-                seen.add(a['link'])
-                unique.append(a)
-        database['categories'][cat_key]['articles'] = unique[:6]
-    
     # 生成摘要
     summaries = []
     used_sources = set()
@@ -173,48 +294,44 @@ def build_database():
         if len(summaries) >= 3:
             break
     
-    database['summaries'] = [summaries]
+    database = {
+        "summaries": [summaries],
+        "categories": new_categories({key: list(by_link.values())[:6] for key, by_link in articles_by_cat.items()})
+    }
     
     total = sum(len(v['articles']) for v in database['categories'].values())
     print(f"\n✓ 总计: {total} 篇文章")
     
     return database
 
-def update_html():
-    """更新HTML文件"""
+def update_data(offline=False):
+    """更新 data.js 中的 contentDatabase"""
     try:
-        print("\n正在更新 index.html...")
-        
-        with open('index.html', 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        new_db = build_database()
-        json_str = json.dumps(new_db, ensure_ascii=False, indent=8)
+        print(f"\n正在更新 {DATA_JS_FILE}...")
         
-        # 替换 contentDatabase
-        pattern = r'const contentDatabase\s*=\s*\{[\s\S]*?\};'
-        replacement = f'const contentDatabase = {json_str};'
-        new_html = re.sub(pattern, replacement, html_content)
+        new_db = build_database(offline)
+        if new_db is None:
+            print(f"✗ 未写入 {DATA_JS_FILE}")
+            return False
+        new_content = (
+            "// 由 scripts/update_news.py 自动生成，请勿手动编辑\n"
+            f"const contentDatabase = {json.dumps(new_db, ensure_ascii=False, indent=2)};\n"
+        )
         
-        # 如果正则失败，使用字符串查找
-        if new_html == html_content:
-            start_marker = 'const contentDatabase = {'
-            start_idx = html_content.find(start_marker)
-            if start_idx != -1:
-                brace_count = 1
-                i = start_idx + len(start_marker)
-                while i < len(html_content) and brace_count > 0:
-                    if html_content[i] == '{':
-                        brace_count += 1
-                    elif html_content[i] == '}':
-                        brace_count -= 1
-                    i += 1
-                
-                if brace_count == 0:
-                    new_html = html_content[:start_idx] + f'const contentDatabase = {json_str};' + html_content[i:]
+        # 数据未变化时不重写文件
+        try:
+            with open(DATA_JS_FILE, 'r', encoding='utf-8') as f:
+                if f.read() == new_content:
+                    print("✓ 内容无变化，跳过写入")
+                    return True
+        except FileNotFoundError:
+            pass
         
-        with open('index.html', 'w', encoding='utf-8') as f:
-            f.write(new_html)
+        # 先写临时文件再原子替换，避免写到一半损坏数据
+        tmp_path = DATA_JS_FILE + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        os.replace(tmp_path, DATA_JS_FILE)
         
         print("✓ 更新成功")
         return True
@@ -226,4 +343,5 @@ def update_html():
 if __name__ == '__main__':
     print("🤖 DATOU AI News")
     print(f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    update_html()
+    # --offline: 不访问网络，直接用 .feed_cache.json 中上次解析的条目重建数据
+    update_data(offline='--offline' in sys.argv[1:])